@@ -21,23 +21,35 @@ Usage (hook dispatch — reads stdin, exits immediately):
 """
 
 import argparse
+import os
 import re
 import subprocess
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import groupby
 from pathlib import Path
 
 PROJECT_PREFIX = "io.amichne"
 
 # Modules whose public types are designed to be consumed externally.
 # Orphaned public types here are reported as API surface, not dead code.
-API_SURFACE_MODULES = {
+API_SURFACE_MODULES = frozenset({
     "openfeature",
     "kontracts",
     "konditional-http-server",
     "konditional-otel",
-}
+})
+
+# Patterns used on every parsed line / declaration; compiled once at import.
+# Sig header lines parse_sig_file cares about; all other lines are skipped.
+_HEADER_LINE_RE = re.compile(r"^(package|imports|type)=(.*)$", re.MULTILINE)
+# Leading annotations are skipped inside the match; (?!\w) stops "@Ainternal"
+# from backtracking into "@A" + "internal".
+_VISIBILITY_RE = re.compile(r'\s*(?:@\w+(?!\w)\s*)*(private|internal)\b')
+_KT_IMPORT_RE = re.compile(r'^import\s+([\w.]+?)(\.\*)?[ \t]*$', re.MULTILINE)
+_SIMPLE_NAME_RE = re.compile(r'\b[A-Z][A-Za-z0-9_]*\b')
 
 
 # ---------------------------------------------------------------------------
@@ -56,27 +68,30 @@ def _is_test(path: Path) -> bool:
 
 
 def _module_of(path: Path, sig_dir: Path) -> str:
-    return path.relative_to(sig_dir).parts[0]
+    # Interned: a handful of distinct modules shared by every SigFile and
+    # TypeEntry, compared and hashed in the reference and same-package passes.
+    return sys.intern(path.relative_to(sig_dir).parts[0])
 
 
 def _detect_visibility(decl: str) -> str:
     """Infer Kotlin visibility from the declaration string."""
-    # Strip leading annotations/whitespace before checking modifier
-    stripped = re.sub(r'@\w+\s*', '', decl).strip()
-    if re.match(r'private\b', stripped):
-        return "private"
-    if re.match(r'internal\b', stripped):
-        return "internal"
-    return "public"
+    # One anchored match skips leading annotations/whitespace and captures
+    # the modifier.
+    m = _VISIBILITY_RE.match(decl)
+    return m.group(1) if m else "public"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeEntry:
     fqcn: str
     sig_file: Path
     module: str
     visibility: str   # "public" | "internal" | "private"
     kind: str
+    # Derived from fqcn once at parse time; read in the classify, rescue and
+    # report passes.
+    simple_name: str
+    package: str
     is_api_surface: bool = False
     # All FQCNs that refer to this type (primary + nested-class aliases).
     # e.g. primary "io.amichne.x.Foo", alias "io.amichne.x.Context.Foo"
@@ -86,12 +101,16 @@ class TypeEntry:
     supertypes: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SigFile:
     path: Path
     module: str
     is_main: bool
     is_test: bool
+    # Kotlin source path relative to the project root ("Foo.kt.sig" → "Foo.kt"),
+    # derived once per file; used for exclusion matching and report links.
+    src_rel: str = ""
+    package: str = ""
     imports: list[str] = field(default_factory=list)
     defined_types: list[TypeEntry] = field(default_factory=list)
     raw_content: str = ""
@@ -100,47 +119,68 @@ class SigFile:
 def parse_sig_file(path: Path, sig_dir: Path) -> SigFile:
     content = path.read_text(encoding="utf-8", errors="replace")
     module = _module_of(path, sig_dir)
+    # Module membership is per file, not per type; probe it once.
+    is_api_surface = module in API_SURFACE_MODULES
     sf = SigFile(
         path=path,
         module=module,
         is_main=_is_main(path),
         is_test=_is_test(path),
+        src_rel=path.relative_to(sig_dir).with_suffix("").as_posix(),
         raw_content=content,
     )
 
     # Extract the file stem from the "file=" line so we can generate
     # nested-class aliases.  e.g. "Context.kt" → stem "Context".
+    # The header sits at the top of the file; str.find jumps straight to it.
     file_stem: str = ""
-    for line in content.splitlines():
-        if line.startswith("file="):
-            raw_file = line[len("file="):].strip()
-            file_stem = Path(raw_file).stem  # "Context.kt" → "Context"
-            break
-
-    for line in content.splitlines():
-        if line.startswith("imports="):
-            raw = line[len("imports="):].strip()
+    if content.startswith("file="):
+        header_start = 0
+    else:
+        header_start = content.find("\nfile=")
+        if header_start != -1:
+            header_start += 1  # skip the newline
+    if header_start != -1:
+        header_end = content.find("\n", header_start)
+        if header_end == -1:
+            header_end = len(content)
+        raw_file = content[header_start + len("file="):header_end].strip()
+        file_stem = Path(raw_file).stem  # "Context.kt" → "Context"
+
+    # Single scan over the content collecting package=, imports= and type=
+    # headers; later stages read these fields from the SigFile.
+    for header in _HEADER_LINE_RE.finditer(content):
+        key = header.group(1)
+        if key == "package":
+            # First package= line wins, matching the original line scan.
+            if not sf.package:
+                sf.package = sys.intern(header.group(2).strip())
+        elif key == "imports":
+            raw = header.group(2).strip()
             sf.imports = [
                 i.strip()
                 for i in raw.split(",")
                 if i.strip().startswith(PROJECT_PREFIX)
             ]
-        elif line.startswith("type="):
-            # Strip optional |supertypes=... suffix before applying the main
-            # regex so that decl= captures only the declaration text.
-            supertypes_raw = ""
-            type_line = line
-            st_match = re.search(r"\|supertypes=(.+)$", line)
-            if st_match:
-                supertypes_raw = st_match.group(1)
-                type_line = line[: st_match.start()]
-
-            # type=<FQCN>|kind=<kind>|decl=<decl>
-            m = re.match(r"type=([^|]+)\|kind=([^|]+)\|decl=(.*)", type_line)
-            if m:
-                fqcn = m.group(1).strip()
-                kind = m.group(2).strip()
-                decl = m.group(3).strip()
+        else:
+            # <FQCN>|kind=<kind>|decl=<decl>[|supertypes=<FQCN>,...] — split
+            # with str.partition; the optional suffix is peeled off decl so
+            # that decl= captures only the declaration text.  FQCN and kind
+            # must be non-empty and free of "|", otherwise the line is skipped.
+            fqcn, has_kind, rest = header.group(2).partition("|kind=")
+            kind, has_decl, decl = rest.partition("|decl=")
+            if (
+                has_kind
+                and has_decl
+                and fqcn
+                and kind
+                and "|" not in fqcn
+                and "|" not in kind
+            ):
+                decl, _, supertypes_raw = decl.partition("|supertypes=")
+                fqcn = fqcn.strip()
+                kind = kind.strip()
+                decl = decl.strip()
                 visibility = _detect_visibility(decl)
 
                 # Resolved supertype FQCNs emitted by the generator.
@@ -156,8 +196,7 @@ def parse_sig_file(path: Path, sig_dir: Path) -> SigFile:
                 # a file whose stem differs from its own simple name, other
                 # files will import it as "{package}.{FileStem}.{SimpleName}"
                 # (e.g. Context.StableIdContext) rather than the bare FQCN.
-                simple_name = fqcn.rsplit(".", 1)[-1]
-                package = fqcn.rsplit(".", 1)[0] if "." in fqcn else ""
+                package, _, simple_name = fqcn.rpartition(".")
                 aliases: list[str] = []
                 if file_stem and file_stem != simple_name and package:
                     aliases.append(f"{package}.{file_stem}.{simple_name}")
@@ -168,7 +207,9 @@ def parse_sig_file(path: Path, sig_dir: Path) -> SigFile:
                     module=module,
                     visibility=visibility,
                     kind=kind,
-                    is_api_surface=module in API_SURFACE_MODULES,
+                    simple_name=simple_name,
+                    package=package,
+                    is_api_surface=is_api_surface,
                     aliases=aliases,
                     supertypes=supertypes,
                 ))
@@ -241,7 +282,7 @@ def remove_file_exclusion(exclusions_file: Path, project_root: Path, edited_abs:
 # ---------------------------------------------------------------------------
 
 
-def _refs_from_content(content: str, known_fqcns: set[str]) -> set[str]:
+def _refs_from_content(content: str, known_fqcns: frozenset[str]) -> set[str]:
     """
     Scan raw sig content for known project FQCNs.
 
@@ -249,11 +290,7 @@ def _refs_from_content(content: str, known_fqcns: set[str]) -> set[str]:
     ~300 known types). This catches FQCNs embedded in decl strings, method
     signatures, and field declarations that may not appear in imports.
     """
-    found = set()
-    for fqcn in known_fqcns:
-        if fqcn in content:
-            found.add(fqcn)
-    return found
+    return {fqcn for fqcn in known_fqcns if fqcn in content}
 
 
 # ---------------------------------------------------------------------------
@@ -261,8 +298,19 @@ def _refs_from_content(content: str, known_fqcns: set[str]) -> set[str]:
 # ---------------------------------------------------------------------------
 
 
+# Upper bound on .kt files read ahead of the import scan at any one time.
+_KT_READ_BATCH = 64
+
+
+def _read_kt(kt_file: Path) -> str | None:
+    try:
+        return kt_file.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+
+
 def _build_kt_import_index(
-    project_root: Path, sig_dir: Path
+    project_root: Path, sig_dir: Path, workers: int | None = None
 ) -> tuple[dict[str, set[Path]], dict[str, set[Path]]]:
     """
     Scan every .kt file under project_root and index their import statements.
@@ -275,27 +323,46 @@ def _build_kt_import_index(
     live reference.  This gives us a zero-false-positive rescue pass for types
     that look orphaned in the sig graph — the sig scanner can miss references
     that appear in generated code, annotation processors, or import aliases.
+
+    File reads are I/O-bound and release the GIL, so they are fanned out over
+    a thread pool of `workers` threads (executor default when None); regex
+    scanning stays on the calling thread, in walk order.
     """
-    _IMPORT = re.compile(r'^import\s+([\w.]+?)(\.\*)?[ \t]*$', re.MULTILINE)
     exact: dict[str, set[Path]] = defaultdict(set)
     star: dict[str, set[Path]] = defaultdict(set)
 
-    for kt_file in project_root.rglob("*.kt"):
-        try:
-            kt_file.relative_to(sig_dir)
-            continue  # inside sig_dir — skip
-        except ValueError:
-            pass
-        try:
-            content = kt_file.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            continue
-        for m in _IMPORT.finditer(content):
-            target = m.group(1)
-            if m.group(2):   # ends with .*
-                star[target].add(kt_file)
-            else:
-                exact[target].add(kt_file)
+    # Walk the project, pruning sig_dir and .git so their trees are never
+    # listed.  Both sides are compared as absolute, normalised paths so a
+    # relative or "./"-prefixed sig_dir still matches the walk's dirpaths.
+    sig_dir_abs = os.path.abspath(sig_dir)
+    root_abs = os.path.abspath(project_root)
+    if root_abs == sig_dir_abs or root_abs.startswith(os.path.join(sig_dir_abs, "")):
+        # e.g. sig_dir=Path("."): the walk root is sig_dir itself, and every
+        # .kt file beneath it is inside sig_dir.
+        return exact, star
+    kt_files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [
+            d for d in dirnames
+            if d != ".git" and os.path.abspath(os.path.join(dirpath, d)) != sig_dir_abs
+        ]
+        kt_files.extend(Path(dirpath, name) for name in filenames if name.endswith(".kt"))
+
+    # Reads are submitted in fixed-size batches, so at most _KT_READ_BATCH
+    # files' text is held at once however far the workers get ahead of the
+    # scan below.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(kt_files), _KT_READ_BATCH):
+            batch = kt_files[start:start + _KT_READ_BATCH]
+            for kt_file, content in zip(batch, pool.map(_read_kt, batch)):
+                if content is None:
+                    continue
+                for m in _KT_IMPORT_RE.finditer(content):
+                    target = m.group(1)
+                    if m.group(2):   # ends with .*
+                        star[target].add(kt_file)
+                    else:
+                        exact[target].add(kt_file)
 
     return exact, star
 
@@ -305,34 +372,34 @@ def _build_kt_import_index(
 # ---------------------------------------------------------------------------
 
 
-def _package_of(content: str) -> str:
-    """Extract the 'package=' value from raw sig content."""
-    for line in content.splitlines():
-        if line.startswith("package="):
-            return line[len("package="):].strip()
-    return ""
-
-
-def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
+def analyse(
+    sig_dir: Path,
+    exclusions_file: Path | None = None,
+    workers: int | None = None,
+) -> str:
     all_sigs = list(sig_dir.rglob("*.sig"))
     if not all_sigs:
         return f"No .sig files found under {sig_dir}"
 
     project_root = sig_dir.parent
     file_excl, pkg_excl = load_exclusions(exclusions_file) if exclusions_file else (set(), [])
+    # Package exclusions match exactly or as a dotted prefix.
+    pkg_excl_exact = frozenset(pkg_excl)
+    pkg_excl_prefixes = tuple(p + "." for p in pkg_excl)
 
     def _is_excluded(entry: TypeEntry) -> bool:
-        rel_sig = entry.sig_file.relative_to(sig_dir)
-        src_rel = str(rel_sig.with_suffix(""))   # strip .sig → Foo.kt
-        if src_rel in file_excl:
+        sf = sig_by_path[entry.sig_file]
+        if sf.src_rel in file_excl:
             return True
-        pkg = _package_of(entry.sig_file.read_text(encoding="utf-8", errors="replace"))
-        return any(pkg == p or pkg.startswith(p + ".") for p in pkg_excl)
+        pkg = sf.package
+        return pkg in pkg_excl_exact or pkg.startswith(pkg_excl_prefixes)
 
     parsed: list[SigFile] = [parse_sig_file(p, sig_dir) for p in all_sigs]
 
     main_sigs = [sf for sf in parsed if sf.is_main]
     test_sigs = [sf for sf in parsed if sf.is_test]
+    # Every TypeEntry points back at its parsed SigFile (package, src_rel).
+    sig_by_path: dict[Path, SigFile] = {sf.path: sf for sf in main_sigs}
 
     # Collect all non-private types from main sources.
     # Register both the primary FQCN and any nested-class aliases so that
@@ -347,25 +414,29 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
                 for alias in t.aliases:
                     all_main_types[alias] = t   # alias → same TypeEntry
 
-    known_fqcns = set(all_main_types)
+    known_fqcns = frozenset(all_main_types)
 
     # Index: (module, package) → list of SigFile, for same-package implicit ref resolution
     module_package_sigs: dict[tuple[str, str], list[SigFile]] = defaultdict(list)
     for sf in main_sigs:
-        pkg = _package_of(sf.raw_content)
-        module_package_sigs[(sf.module, pkg)].append(sf)
+        module_package_sigs[(sf.module, sf.package)].append(sf)
 
     # Build inbound ref counts
     # main_refs[fqcn] = set of sig file paths (in main sources) that reference fqcn
     main_refs: dict[str, set[str]] = defaultdict(set)
     test_refs: dict[str, set[str]] = defaultdict(set)
 
+    def _referenced_types(sf: SigFile) -> list[TypeEntry]:
+        """Main-source types sf references via imports or embedded FQCNs."""
+        refs = _refs_from_content(sf.raw_content, known_fqcns)
+        refs.update(known_fqcns.intersection(sf.imports))
+        # known_fqcns is exactly the key set of all_main_types
+        return [all_main_types[ref] for ref in refs]
+
     for sf in main_sigs:
-        refs = (set(sf.imports) & known_fqcns) | _refs_from_content(sf.raw_content, known_fqcns)
-        for ref in refs:
-            t = all_main_types.get(ref)
-            if t is None or t.sig_file == sf.path:
-                continue  # skip missing / self-reference
+        for t in _referenced_types(sf):
+            if t.sig_file == sf.path:
+                continue  # skip self-reference
             # Internal types only count refs from within the same module
             if t.visibility == "internal" and t.module != sf.module:
                 continue
@@ -373,11 +444,8 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
             main_refs[t.fqcn].add(sf.path.as_posix())
 
     for sf in test_sigs:
-        refs = (set(sf.imports) & known_fqcns) | _refs_from_content(sf.raw_content, known_fqcns)
-        for ref in refs:
-            t = all_main_types.get(ref)
-            if t is not None:
-                test_refs[t.fqcn].add(sf.path.as_posix())
+        for t in _referenced_types(sf):
+            test_refs[t.fqcn].add(sf.path.as_posix())
 
     # Supertype-based inbound refs: if type A implements/extends type B,
     # count it as B having an inbound reference from A.
@@ -411,10 +479,8 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
     test_only: list[tuple] = []
     low_usage: list[tuple] = []
 
-    for fqcn, entry in sorted(
-        ((k, v) for k, v in all_main_types.items() if k in canonical_fqcns),
-        key=lambda kv: kv[0],
-    ):
+    for fqcn in sorted(canonical_fqcns):
+        entry = all_main_types[fqcn]
         if _is_excluded(entry):
             continue  # assume fully-used until the file is next edited
 
@@ -425,19 +491,16 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
         # Same-package usage in Kotlin never generates an import statement,
         # so explicit ref counts will be 0 even when the type is actively used.
         if m_count == 0 and entry.visibility == "internal":
-            pkg = _package_of(entry.sig_file.read_text(encoding="utf-8", errors="replace"))
-            key = (entry.module, pkg)
+            key = (entry.module, sig_by_path[entry.sig_file].package)
             if key not in same_package_simple_names:
-                combined = ""
-                for sibling in module_package_sigs.get(key, []):
-                    if sibling.path != entry.sig_file:
-                        combined += sibling.raw_content
-                same_package_simple_names[key] = set()
+                combined = "".join(
+                    sibling.raw_content
+                    for sibling in module_package_sigs.get(key, [])
+                    if sibling.path != entry.sig_file
+                )
                 # We want whole-word matches to avoid "Int" matching "IntFeature"
-                for word in re.findall(r'\b[A-Z][A-Za-z0-9_]*\b', combined):
-                    same_package_simple_names[key].add(word)
-            simple_name = fqcn.rsplit(".", 1)[-1]
-            if simple_name in same_package_simple_names.get(key, set()):
+                same_package_simple_names[key] = set(_SIMPLE_NAME_RE.findall(combined))
+            if entry.simple_name in same_package_simple_names.get(key, set()):
                 m_count = 1  # treat as implicitly referenced; promote out of ORPHANED
 
         # An internal type that directly implements a public project interface
@@ -471,27 +534,26 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
     # -----------------------------------------------------------------------
 
     def _source_path(entry: TypeEntry) -> Path:
-        rel = entry.sig_file.relative_to(sig_dir)
-        return sig_dir.parent / rel.with_suffix("")  # Foo.kt.sig → Foo.kt
+        return project_root / sig_by_path[entry.sig_file].src_rel
 
     kt_referenced: list[tuple] = []
     true_orphaned: list[tuple] = []
 
     if orphaned_internal:
-        exact_imports, star_imports = _build_kt_import_index(project_root, sig_dir)
+        exact_imports, star_imports = _build_kt_import_index(project_root, sig_dir, workers)
         for item in orphaned_internal:
             fqcn, entry, m, t = item
             own_src = _source_path(entry)
-            package = fqcn.rsplit(".", 1)[0] if "." in fqcn else ""
+            package = entry.package
 
             # Gather every kt file that provably references this type:
             #   - exact import of the canonical FQCN or any nested-class alias
             #   - star import of the type's package
-            ref_files: set[Path] = set()
-            for key in [fqcn] + entry.aliases:
-                ref_files |= exact_imports.get(key, set())
+            ref_files: set[Path] = set(exact_imports.get(fqcn, ()))
+            for alias in entry.aliases:
+                ref_files.update(exact_imports.get(alias, ()))
             if package:
-                ref_files |= star_imports.get(package, set())
+                ref_files.update(star_imports.get(package, ()))
             ref_files.discard(own_src)
 
             if ref_files:
@@ -528,23 +590,20 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
     def file_link(path: Path, display: str) -> str:
         return f'<a href="file://{path}" style="color:#0550ae;text-decoration:none;font-family:monospace">{display}</a>'
 
-    # Collect all findings into (tier, fqcn, entry, m, t) tuples
+    # Collect all findings into (tier, fqcn, entry, m, t) tuples sorted by
+    # (module, tier, fqcn); the report groups them by module with groupby.
     all_findings: list[tuple[str, str, TypeEntry, int, int]] = [
-        ("ORPHANED",    *item) for item in orphaned_internal
-    ] + [
-        ("KT-REF",      *item) for item in kt_referenced
-    ] + [
-        ("TEST-ONLY",   *item) for item in test_only
-    ] + [
-        ("LOW-USAGE",   *item) for item in low_usage
-    ] + [
-        ("API-SURFACE", *item) for item in orphaned_api_surface
+        (tier, *item)
+        for tier, items in (
+            ("ORPHANED",    orphaned_internal),
+            ("KT-REF",      kt_referenced),
+            ("TEST-ONLY",   test_only),
+            ("LOW-USAGE",   low_usage),
+            ("API-SURFACE", orphaned_api_surface),
+        )
+        for item in items
     ]
-
-    # Group by module
-    by_module: dict[str, list[tuple[str, str, TypeEntry, int, int]]] = defaultdict(list)
-    for finding in all_findings:
-        by_module[finding[2].module].append(finding)
+    all_findings.sort(key=lambda f: (f[2].module, TIER_ORDER[f[0]], f[1]))
 
     healthy_count = len(canonical_fqcns) - len(all_findings)
 
@@ -604,9 +663,7 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
     if not all_findings:
         html.append("<p>No findings — all types are healthy.</p>")
     else:
-        for module in sorted(by_module):
-            findings = by_module[module]
-            findings.sort(key=lambda f: (TIER_ORDER[f[0]], f[1]))
+        for module, findings in groupby(all_findings, key=lambda f: f[2].module):
 
             html.append(f"<h2>{module}</h2>")
             html.append("<table>")
@@ -617,7 +674,7 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
             html.append("<tbody>")
 
             for tier, fqcn, entry, m, t in findings:
-                simple = fqcn.rsplit(".", 1)[-1]
+                simple = entry.simple_name
                 src = source_path(entry)
                 html.append("<tr>")
                 html.append(f"<td>{badge(tier)}</td>")
@@ -644,7 +701,6 @@ def analyse(sig_dir: Path, exclusions_file: Path | None = None) -> str:
 
 def hook_mode() -> None:
     import json
-    import os
 
     data = json.load(sys.stdin)
     tool_input = data.get("tool_input", {})
@@ -684,6 +740,16 @@ def hook_mode() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return n
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Sig reachability / dead-code scanner")
     parser.add_argument(
@@ -705,6 +771,12 @@ def main() -> None:
             "dotted identifiers are treated as package prefixes."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Threads used to read .kt files in the import-rescue pass (default: executor default)",
+    )
     parser.add_argument(
         "--hook-mode",
         action="store_true",
@@ -727,7 +799,7 @@ def main() -> None:
         # Default: <project-root>/.claude/sig-reachability-exclusions.txt
         exclusions_file = (sig_dir.parent / ".claude" / "sig-reachability-exclusions.txt").resolve()
 
-    report = analyse(sig_dir, exclusions_file=exclusions_file)
+    report = analyse(sig_dir, exclusions_file=exclusions_file, workers=args.workers)
 
     if args.report_file == "-":
         print(report)